@@ -0,0 +1,31 @@
+"""CPU affinity: keep gRPC IO and CTranslate2 compute on separate cores (Linux only)."""
+
+import os
+
+
+def usable_cpus() -> list[int]:
+    """CPUs this process may run on; honours cpuset/taskset limits where supported."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def split_cpus() -> tuple[set[int], set[int]]:
+    """Split the CPUs this process may use into (io_cores, compute_cores)."""
+    cpus = usable_cpus()
+
+    if len(cpus) < 2:
+        return set(cpus), set(cpus)
+
+    # The event loop needs a core or two for gRPC IO; compute gets the rest
+    io_count = 1 if len(cpus) < 16 else 2
+    return set(cpus[:io_count]), set(cpus[io_count:])
+
+
+IO_CORES, COMPUTE_CORES = split_cpus()
+
+
+def pin_current_thread(cores: set[int]) -> None:
+    """Pin the calling thread (and threads it spawns later) to ``cores``."""
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
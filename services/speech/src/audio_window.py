@@ -0,0 +1,110 @@
+"""Bounded PCM16 utterance window backed by pooled fixed-size blocks."""
+
+import queue
+from collections import deque
+
+
+class BlockPool:
+    """
+    Bounded pool of reusable fixed-size byte blocks.
+
+    Windows take blocks as audio arrives and return them once it has been
+    transcribed or dropped, so memory follows the audio actually buffered.
+    """
+
+    def __init__(self, block_size: int, max_pooled: int):
+        self.block_size = block_size
+        self._blocks: queue.Queue[bytearray] = queue.Queue(maxsize=max_pooled)
+
+    def acquire(self) -> bytearray:
+        try:
+            return self._blocks.get_nowait()
+        except queue.Empty:
+            return bytearray(self.block_size)
+
+    def release(self, block: bytearray) -> None:
+        try:
+            self._blocks.put_nowait(block)
+        except queue.Full:
+            pass
+
+
+class AudioWindow:
+    """
+    The newest ``capacity`` bytes of a PCM16 stream.
+
+    Audio is copied into pooled blocks. Dropping old audio only advances a
+    head offset and hands whole blocks back to the pool, so no buffered
+    byte is ever moved. Drops are rounded up to an even byte so samples
+    stay aligned. Not thread-safe; the owning session serializes access.
+    """
+
+    def __init__(self, capacity: int, pool: BlockPool):
+        self.capacity = capacity - (capacity & 1)
+        self._pool = pool
+        self._blocks: deque[bytearray] = deque()
+        self._head = 0  # offset of the oldest byte in _blocks[0]
+        self._tail = 0  # bytes used in _blocks[-1]
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, chunk: bytes | memoryview) -> None:
+        """Copy ``chunk`` in, dropping the oldest audio beyond capacity."""
+        view = memoryview(chunk)
+
+        excess = self._len + len(view) - self.capacity
+        if excess > 0:
+            excess += excess & 1
+            if excess >= self._len:
+                # Nothing buffered survives; keep only the chunk's tail
+                view = view[excess - self._len:]
+                self.clear()
+            else:
+                self._drop(excess)
+
+        block_size = self._pool.block_size
+        while view:
+            if not self._blocks or self._tail == block_size:
+                self._blocks.append(self._pool.acquire())
+                self._tail = 0
+            n = min(len(view), block_size - self._tail)
+            self._blocks[-1][self._tail:self._tail + n] = view[:n]
+            self._tail += n
+            self._len += n
+            view = view[n:]
+
+    def keep_last(self, nbytes: int) -> None:
+        """Drop all but the newest ``nbytes``, cutting on an even byte."""
+        excess = self._len - nbytes
+        if excess > 0:
+            self._drop(min(self._len, excess + (excess & 1)))
+
+    def tobytes(self) -> bytes:
+        """Linearize the window into one contiguous copy."""
+        last = len(self._blocks) - 1
+        return b"".join(
+            memoryview(block)[
+                self._head if i == 0 else 0:
+                self._tail if i == last else len(block)
+            ]
+            for i, block in enumerate(self._blocks)
+        )
+
+    def clear(self) -> None:
+        """Empty the window and hand its blocks back to the pool."""
+        while self._blocks:
+            self._pool.release(self._blocks.popleft())
+        self._head = self._tail = self._len = 0
+
+    def _drop(self, nbytes: int) -> None:
+        self._len -= nbytes
+        if self._len == 0:
+            self.clear()
+            return
+        self._head += nbytes
+        block_size = self._pool.block_size
+        while self._head >= block_size:
+            self._pool.release(self._blocks.popleft())
+            self._head -= block_size
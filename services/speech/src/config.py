@@ -4,10 +4,12 @@ import os
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
+from .affinity import COMPUTE_CORES, usable_cpus
+
 load_dotenv()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class STTConfig:
     """Speech-to-Text configuration."""
     
@@ -17,18 +19,31 @@ class STTConfig:
     post_speech_silence_duration: float = 0.5  # Seconds of silence before finalizing
     min_speech_duration: float = 0.2  # Minimum speech duration to consider valid (seconds)
     sample_rate: int = 16000  # Audio sample rate (Hz)
+    beam_size: int = 1  # Whisper beam width (1 = greedy, lowest latency)
+    compute_type: str = "auto"  # CTranslate2 compute type ("auto" = fastest supported int8 variant)
+    max_buffer_seconds: float = 30.0  # Keep only the most recent audio of an utterance (seconds)
+    partial_interval: float = 1.0  # Seconds of new audio between partial transcriptions
+    whisper_workers: int = 1  # Concurrent Whisper decodes; compute cores are split between them
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServerConfig:
     """gRPC server configuration."""
     
     host: str = "0.0.0.0"
     port: int = 50051
     max_workers: int = 10
+    max_sessions: int = 100  # cap on live sessions, least recently fed evicted first
+    session_idle_ttl_s: float = 300.0  # Reap sessions idle longer than this (seconds)
+    pin_cpus: bool = False  # Reserve a core for gRPC IO, pin Whisper to the rest (Linux only)
+
+    @property
+    def compute_cpus(self) -> int:
+        """Cores Whisper may use: the compute set when pinning, else all of them."""
+        return len(COMPUTE_CORES) if self.pin_cpus else len(usable_cpus())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Application configuration."""
     
@@ -46,14 +61,22 @@ class AppConfig:
                 post_speech_silence_duration=float(os.getenv("STT_SILENCE_DURATION", "0.8")),
                 min_speech_duration=float(os.getenv("STT_MIN_SPEECH_DURATION", "0.3")),
                 sample_rate=int(os.getenv("STT_SAMPLE_RATE", "16000")),
+                beam_size=int(os.getenv("STT_BEAM_SIZE", "1")),
+                compute_type=os.getenv("STT_COMPUTE_TYPE", "auto"),
+                max_buffer_seconds=float(os.getenv("STT_MAX_BUFFER_SECONDS", "30")),
+                partial_interval=float(os.getenv("STT_PARTIAL_INTERVAL", "1.0")),
+                whisper_workers=int(os.getenv("STT_WHISPER_WORKERS", "1")),
             ),
             server=ServerConfig(
                 host=os.getenv("GRPC_HOST", "0.0.0.0"),
                 port=int(os.getenv("GRPC_PORT", "50051")),
                 max_workers=int(os.getenv("GRPC_MAX_WORKERS", "10")),
+                max_sessions=int(os.getenv("GRPC_MAX_SESSIONS", "100")),
+                session_idle_ttl_s=float(os.getenv("SESSION_IDLE_TTL", "300")),
+                pin_cpus=os.getenv("GRPC_PIN_CPUS", "false").lower() in ("1", "true", "yes"),
             ),
         )
 
 
-# Global config instance
+# Global config instance (read-only; parsed once at import)
 config = AppConfig.from_env()
@@ -1,16 +1,18 @@
 """gRPC server implementation for Speech Service (STT, utterance-level)."""
 
+import argparse
+import asyncio
+import functools
 import logging
 import signal
 import sys
-import threading
 from concurrent import futures
-from queue import Queue
 
 import grpc
 
+from .affinity import COMPUTE_CORES, IO_CORES, pin_current_thread
 from .config import config
-from .session_manager import session_manager
+from .session_manager import session_manager, transcription_pool, warmup_models
 
 try:
     from . import speech_pb2
@@ -26,54 +28,98 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Keepalive and HTTP/2 tuning for long-lived audio streams. Clients should
+# match: keepalive ping every 30s with a 10s timeout, allowed without an
+# active stream (see pkg/speech/client.go); pings closer than 10s apart are
+# rejected by the server.
+SERVER_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_time_between_pings_ms", 10_000),
+    ("grpc.http2.min_ping_interval_without_data_ms", 10_000),
+    ("grpc.max_concurrent_streams", 1000),
+    ("grpc.max_receive_message_length", 4 * 1024 * 1024),
+]
+
 
 class SpeechServicer(speech_pb2_grpc.SpeechServiceServicer):
 
-    def StreamTranscribe(self, request_iterator, context):
+    def __init__(self, vad_pool: futures.ThreadPoolExecutor):
+        # Per-chunk VAD runs here so it never blocks the event loop; Whisper
+        # decodes go to the shared transcription pool
+        self._vad_pool = vad_pool
+
+    async def StreamTranscribe(self, request_iterator, context):
         """
         Utterance-level STT stream.
-        Emits exactly one transcription per detected utterance.
+        Emits exactly one final transcription per detected utterance.
+        Clients that set partial_results also get in-progress text for the
+        current utterance, flagged partial=True.
         Safe for STT → LLM → TTS pipelines.
         """
 
+        loop = asyncio.get_running_loop()
         session = None
         session_id = None
+        attaching: asyncio.Future | None = None
 
-        # Queue carries ONLY completed utterances (strings)
-        utterance_queue: Queue[str | None] = Queue()
+        # Queue carries (text, partial) pairs; None ends the stream
+        utterance_queue: asyncio.Queue[tuple[str, bool] | None] = asyncio.Queue()
 
         def transcription_callback(text: str):
             """
             Called by SpeechSession ONLY when an utterance is complete
-            (post-VAD silence).
+            (post-VAD silence). Runs on a transcription thread.
             """
-            if context.is_active():
-                utterance_queue.put(text)
+            loop.call_soon_threadsafe(utterance_queue.put_nowait, (text, False))
+
+        def partial_callback(text: str):
+            """Called by SpeechSession with in-progress utterance text."""
+            loop.call_soon_threadsafe(utterance_queue.put_nowait, (text, True))
 
         # ----------------------------------------
-        # Audio ingestion thread (producer)
+        # Audio ingestion task (producer)
         # ----------------------------------------
-        def audio_reader():
-            nonlocal session, session_id
+        async def audio_reader():
+            nonlocal session, session_id, attaching
             try:
-                for request in request_iterator:
-                    if not context.is_active():
-                        break
-
+                async for request in request_iterator:
                     if not request.session_id:
                         logger.warning("Request missing session_id")
                         continue
 
                     if session is None:
                         session_id = request.session_id
-                        session = session_manager.get_or_create(
-                            session_id=session_id,
-                            transcription_callback=transcription_callback,
+                        # May load the shared models if warmup was skipped
+                        # Attached sessions are never reaped mid-stream
+                        attaching = loop.run_in_executor(
+                            self._vad_pool,
+                            functools.partial(
+                                session_manager.attach,
+                                session_id=session_id,
+                                transcription_callback=transcription_callback,
+                                partial_callback=(
+                                    partial_callback
+                                    if request.partial_results
+                                    else None
+                                ),
+                            ),
                         )
+                        # Shielded so a cancelled stream still sees the result
+                        # and can detach
+                        session = await asyncio.shield(attaching)
                         logger.info(f"Session started: {session_id}")
 
                     if request.audio_chunk:
-                        session.feed_audio(request.audio_chunk)
+                        # Awaited in order, so chunks reach VAD sequentially.
+                        # A view over the protobuf bytes is buffered as-is.
+                        await loop.run_in_executor(
+                            self._vad_pool,
+                            session.feed_audio,
+                            memoryview(request.audio_chunk),
+                        )
 
                     if request.end_of_stream:
                         logger.info(f"End of stream received: {session_id}")
@@ -86,36 +132,54 @@ class SpeechServicer(speech_pb2_grpc.SpeechServiceServicer):
                 )
             finally:
                 # Signal completion to response loop
-                utterance_queue.put(None)
+                utterance_queue.put_nowait(None)
 
-        reader_thread = threading.Thread(
-            target=audio_reader,
-            daemon=True,
-            name=f"AudioReader-{id(self)}",
-        )
-        reader_thread.start()
+        reader_task = asyncio.create_task(audio_reader())
 
         # ----------------------------------------
         # Response loop (consumer)
         # ----------------------------------------
         try:
-            while context.is_active():
-                item = utterance_queue.get()
+            while True:
+                item = await utterance_queue.get()
 
                 if item is None:
                     break
 
-                # Emit exactly ONE utterance per response
+                # Emit exactly ONE utterance (or partial) per response
+                text, partial = item
                 yield speech_pb2.TranscribeResponse(
-                    transcription=item,
+                    transcription=text,
                     success=True,
+                    partial=partial,
                 )
 
             # ----------------------------------------
             # Final flush (single, safe)
             # ----------------------------------------
             if session:
-                final_text = session.finalize_transcription()
+                # VAD may have closed an utterance just before end_of_stream;
+                # wait for its decode so the text isn't lost with the stream
+                pending = session.pending_transcriptions()
+                if pending:
+                    await asyncio.wait([asyncio.wrap_future(job) for job in pending])
+
+                # Callbacks queue before their job completes, so all results
+                # are in the queue now
+                while not utterance_queue.empty():
+                    item = utterance_queue.get_nowait()
+                    if item is None:
+                        continue
+                    text, partial = item
+                    yield speech_pb2.TranscribeResponse(
+                        transcription=text,
+                        success=True,
+                        partial=partial,
+                    )
+
+                final_text = await asyncio.wrap_future(
+                    transcription_pool.submit(session.finalize_transcription)
+                )
                 if final_text:
                     yield speech_pb2.TranscribeResponse(
                         transcription=final_text,
@@ -133,17 +197,33 @@ class SpeechServicer(speech_pb2_grpc.SpeechServiceServicer):
             )
 
         finally:
-            if session_id:
-                session_manager.cleanup(session_id)
-                logger.info(f"Session cleaned up: {session_id}")
+            reader_task.cancel()
+
+            if attaching is not None:
+                try:
+                    attached = await attaching
+                except Exception:
+                    pass  # Never attached, nothing to release
+                else:
+                    cleaned = await loop.run_in_executor(
+                        self._vad_pool,
+                        session_manager.detach,
+                        attached,
+                    )
+                    if cleaned:
+                        logger.info(f"Session cleaned up: {session_id}")
 
             logger.debug(f"StreamTranscribe completed: {session_id}")
 
-    def CleanupSession(self, request, context):
+    async def CleanupSession(self, request, context):
         if not request.session_id:
             return speech_pb2.CleanupResponse(success=False)
 
-        success = session_manager.cleanup(request.session_id)
+        success = await asyncio.get_running_loop().run_in_executor(
+            self._vad_pool,
+            session_manager.cleanup,
+            request.session_id,
+        )
         logger.info(
             f"Manual cleanup {'successful' if success else 'failed'}: "
             f"{request.session_id}"
@@ -152,39 +232,76 @@ class SpeechServicer(speech_pb2_grpc.SpeechServiceServicer):
         return speech_pb2.CleanupResponse(success=success)
 
 
-def serve():
+async def serve(warmup: bool = True):
     if speech_pb2_grpc is None:
         logger.error("Proto files not generated")
         sys.exit(1)
 
-    server = grpc.server(
-        futures.ThreadPoolExecutor(
-            max_workers=config.server.max_workers
-        )
+    pin_cpus = config.server.pin_cpus
+    if pin_cpus:
+        # Before the server exists, so gRPC's own threads inherit the IO set
+        pin_current_thread(IO_CORES)
+
+    # The event loop only does gRPC IO; per-chunk VAD goes here, Whisper to
+    # the transcription pool. Pinned pool threads load the model, so CT2 and
+    # OpenMP threads inherit the compute mask.
+    vad_pool = futures.ThreadPoolExecutor(
+        # Compute set when pinning (this thread's own mask is the IO set by
+        # now), otherwise the CPUs the process may actually use
+        max_workers=config.server.compute_cpus,
+        thread_name_prefix="stt-vad",
+        initializer=pin_current_thread if pin_cpus else None,
+        initargs=(COMPUTE_CORES,) if pin_cpus else (),
+    )
+
+    # Streams no longer pin a thread each; Whisper concurrency is bounded by
+    # the transcription pool, so cap streams at the session limit
+    server = grpc.aio.server(
+        options=SERVER_OPTIONS,
+        maximum_concurrent_rpcs=config.server.max_sessions,
     )
 
     speech_pb2_grpc.add_SpeechServiceServicer_to_server(
-        SpeechServicer(),
+        SpeechServicer(vad_pool),
         server,
     )
 
     address = f"{config.server.host}:{config.server.port}"
     server.add_insecure_port(address)
 
-    def shutdown_handler(signum, frame):
+    loop = asyncio.get_running_loop()
+
+    def shutdown_handler():
         logger.info("Shutdown signal received")
-        server.stop(grace=5)
-        sys.exit(0)
+        asyncio.ensure_future(server.stop(grace=5))
+
+    loop.add_signal_handler(signal.SIGINT, shutdown_handler)
+    loop.add_signal_handler(signal.SIGTERM, shutdown_handler)
 
-    signal.signal(signal.SIGINT, shutdown_handler)
-    signal.signal(signal.SIGTERM, shutdown_handler)
+    # Load models before accepting traffic so the first user doesn't pay for it
+    if warmup:
+        await asyncio.wrap_future(transcription_pool.submit(warmup_models))
 
-    server.start()
+    await server.start()
     logger.info(f"Speech Service (STT) started on {address}")
     logger.info("Mode: Utterance-level (LLM-safe)")
+    if pin_cpus:
+        logger.info(f"CPU split: IO {sorted(IO_CORES)}, compute {sorted(COMPUTE_CORES)}")
 
-    server.wait_for_termination()
+    try:
+        await server.wait_for_termination()
+    finally:
+        vad_pool.shutdown(wait=False, cancel_futures=True)
+        transcription_pool.shutdown()
 
 
 if __name__ == "__main__":
-    serve()
+    parser = argparse.ArgumentParser(description="Speech Service (STT) gRPC server")
+    parser.add_argument(
+        "--no-warmup",
+        action="store_true",
+        help="Skip loading models at startup (first request loads them)",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(serve(warmup=not args.no_warmup))
@@ -1,38 +1,98 @@
 """Optimized session manager."""
 
+import functools
+import math
 import threading
 import logging
+import queue
 import time
-import numpy as np
-import torch
-from collections import deque
+from concurrent import futures
 from dataclasses import dataclass, field
 from typing import Callable, Optional
+
+import ctranslate2
+import numpy as np
+import torch
 from faster_whisper import WhisperModel
 
+from .affinity import COMPUTE_CORES, pin_current_thread
+from .audio_window import AudioWindow, BlockPool
+from .config import config
+from .stt_kernels import pcm16_to_f32
+
 logger = logging.getLogger(__name__)
 
+# Config is frozen; bind the fields read on every transcription once
+_MODEL = config.stt.model
+_LANG = config.stt.language
+_BEAM_SIZE = config.stt.beam_size
+
 # Shared resources (loaded once)
-_SHARED_WHISPER_MODEL = None
 _SHARED_VAD_MODEL = None
 _MODEL_LOCK = threading.Lock()
 
+# Streams no longer map to threads, so decode concurrency is its own small
+# setting; each worker decodes on its share of the compute cores
+_COMPUTE_CPUS = config.server.compute_cpus
+_WHISPER_WORKERS = max(1, min(config.stt.whisper_workers, _COMPUTE_CPUS))
+_WHISPER_CPU_THREADS = max(1, _COMPUTE_CPUS // _WHISPER_WORKERS)
+
+# Silero VAD frame size at 16 kHz
+_VAD_FRAME_SAMPLES = 512
+
+# Audio kept ahead of detected speech so onsets aren't clipped
+_PREROLL_SECONDS = 0.5
+
+# Fastest first: int8 weights with VNNI dot-products and float accumulators
+_COMPUTE_TYPE_PREFERENCE = ("int8_float16", "int8_float32", "int8")
+
+
+def select_compute_type(requested: str = "auto") -> str:
+    """Resolve the CPU compute type, picking the fastest supported one for "auto"."""
+    if requested != "auto":
+        return requested
+
+    supported = ctranslate2.get_supported_compute_types("cpu")
+    for compute_type in _COMPUTE_TYPE_PREFERENCE:
+        if compute_type in supported:
+            return compute_type
+    return "default"
+
+
+# Detect CPU features once at import
+_COMPUTE_TYPE = select_compute_type(config.stt.compute_type)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_whisper_model(model_name: str, compute_type: str) -> WhisperModel:
+    model = WhisperModel(
+        model_name,
+        device="cpu",
+        compute_type=compute_type,
+        cpu_threads=_WHISPER_CPU_THREADS,
+        num_workers=_WHISPER_WORKERS
+    )
+    logger.info(
+        f"Loaded shared Whisper model {model_name} ({compute_type}): "
+        f"{_WHISPER_WORKERS} worker(s) x {_WHISPER_CPU_THREADS} CT2 thread(s)"
+    )
+    return model
+
+
+def get_whisper_model(model_name: str, compute_type: str) -> WhisperModel:
+    """Get the process-wide Whisper model for (model_name, compute_type)."""
+    # lru_cache alone may build the same model twice under concurrent misses
+    with _MODEL_LOCK:
+        return _load_whisper_model(model_name, compute_type)
+
 
 def get_shared_models():
     """Get or create shared Whisper and VAD models."""
-    global _SHARED_WHISPER_MODEL, _SHARED_VAD_MODEL
+    global _SHARED_VAD_MODEL
+    
+    whisper_model = get_whisper_model(_MODEL, _COMPUTE_TYPE)
     
     with _MODEL_LOCK:
-        if _SHARED_WHISPER_MODEL is None:
-            _SHARED_WHISPER_MODEL = WhisperModel(
-                "base",
-                device="cpu",
-                compute_type="int8",
-                cpu_threads=8,
-                num_workers=1
-            )
-            logger.info("Loaded shared Whisper model")
-        
         if _SHARED_VAD_MODEL is None:
             _SHARED_VAD_MODEL, _ = torch.hub.load(
                 repo_or_dir='snakers4/silero-vad',
@@ -43,7 +103,139 @@ def get_shared_models():
             _SHARED_VAD_MODEL.eval()
             logger.info("Loaded shared VAD model")
         
-        return _SHARED_WHISPER_MODEL, _SHARED_VAD_MODEL
+        return whisper_model, _SHARED_VAD_MODEL
+
+
+class AudioBufferPool:
+    """
+    Bounded pool of reusable float32 utterance buffers.
+
+    Only standard-size buffers (``capacity`` samples) are recycled; larger
+    requests fall back to plain allocation and are dropped on release.
+    """
+
+    def __init__(self, capacity: int, max_pooled: int):
+        self.capacity = capacity
+        self._floats: queue.Queue[np.ndarray] = queue.Queue(maxsize=max_pooled)
+
+    def acquire_float32(self, size: int) -> np.ndarray:
+        """Get a float32 array of exactly ``size`` samples."""
+        if size > self.capacity:
+            return np.empty(size, dtype=np.float32)
+        try:
+            buf = self._floats.get_nowait()
+        except queue.Empty:
+            buf = np.empty(self.capacity, dtype=np.float32)
+        return buf[:size]
+
+    def release(self, buf: np.ndarray) -> None:
+        """Return a buffer to the pool; non-standard buffers are discarded."""
+        base = buf if buf.base is None else buf.base
+        if base.dtype != np.float32 or base.shape != (self.capacity,):
+            return
+        try:
+            self._floats.put_nowait(base)
+        except queue.Full:
+            pass
+
+
+# Utterances never exceed the buffer cap, so every conversion fits a pooled buffer
+_MAX_BUFFER_SAMPLES = int(config.stt.sample_rate * config.stt.max_buffer_seconds)
+
+_AUDIO_POOL = AudioBufferPool(
+    capacity=_MAX_BUFFER_SAMPLES,
+    max_pooled=_WHISPER_WORKERS * 2,
+)
+
+# Utterance PCM lives in 1 s blocks taken on demand, so an idle session
+# holds no audio memory; keep a few windows' worth around for reuse
+_AUDIO_BLOCKS = BlockPool(
+    block_size=config.stt.sample_rate * 2,
+    max_pooled=math.ceil(config.stt.max_buffer_seconds) * _WHISPER_WORKERS * 2,
+)
+
+
+class TranscriptionPool:
+    """
+    Bounded executor for all Whisper work: finals, partials and flushes.
+
+    One thread per Whisper worker, so decodes queue here instead of piling
+    onto the model, and per-chunk VAD (run on the caller's own pool) never
+    waits behind a multi-second decode. Work that may be skipped (partials)
+    goes through ``try_submit`` and only runs if a worker is free.
+    """
+
+    def __init__(self, workers: int):
+        self._workers = workers
+        self._pending = 0  # queued + running jobs
+        self._lock = threading.Lock()
+        pin_cpus = config.server.pin_cpus
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="whisper",
+            initializer=pin_current_thread if pin_cpus else None,
+            initargs=(COMPUTE_CORES,) if pin_cpus else (),
+        )
+
+    def submit(self, fn: Callable, /, *args) -> futures.Future:
+        with self._lock:
+            self._pending += 1
+        return self._track(self._executor.submit(fn, *args))
+
+    def try_submit(self, fn: Callable, /, *args) -> Optional[futures.Future]:
+        """Submit only if a worker is idle right now; returns None otherwise."""
+        with self._lock:
+            if self._pending >= self._workers:
+                return None
+            self._pending += 1
+        return self._track(self._executor.submit(fn, *args))
+
+    def _track(self, future: futures.Future) -> futures.Future:
+        future.add_done_callback(self._job_done)
+        return future
+
+    def _job_done(self, _future: futures.Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+transcription_pool = TranscriptionPool(_WHISPER_WORKERS)
+
+
+def _decode(whisper_model: WhisperModel, audio_array: np.ndarray, vad_filter: bool = True) -> str:
+    """Run Whisper with the service's decoding parameters."""
+    segments, info = whisper_model.transcribe(
+        audio_array,
+        language=_LANG,
+        beam_size=_BEAM_SIZE,
+        best_of=1,
+        temperature=0.0,
+        without_timestamps=True,
+        # Trim leading/trailing silence before it reaches the decoder
+        vad_filter=vad_filter,
+        vad_parameters=dict(min_silence_duration_ms=200),
+        # Avoid hallucinated repeats carried across silences
+        condition_on_previous_text=False
+    )
+    # Segments are lazy; decoding happens while iterating
+    return " ".join([seg.text for seg in segments]).strip()
+
+
+def warmup_models() -> None:
+    """Load the shared models and run dummy decodes so the first RPC is hot."""
+    whisper_model, _ = get_shared_models()
+    
+    silence = np.zeros(config.stt.sample_rate, dtype=np.float32)
+    # Same parameters as live traffic. With the VAD filter on, this loads
+    # faster-whisper's Silero VAD but strips the silence before decoding...
+    _decode(whisper_model, silence)
+    # ...so decode once more without it to spin up CTranslate2/MKL threads
+    _decode(whisper_model, silence, vad_filter=False)
+    
+    logger.info("Shared models warmed up")
 
 
 @dataclass
@@ -54,19 +246,32 @@ class SpeechSession:
     min_speech_duration: float = 0.2  # seconds
     vad_sensitivity: float = 0.5
     transcription_callback: Optional[Callable[[str], None]] = None
+    # Receives in-progress text of the current utterance while speech continues
+    partial_callback: Optional[Callable[[str], None]] = None
+    partial_interval: float = config.stt.partial_interval  # seconds of new audio
     
-    # Audio buffers (use list of chunks, not BytesIO)
-    _speech_chunks: list[bytes] = field(default_factory=list)
-    _vad_buffer: deque = field(default_factory=lambda: deque(maxlen=8000))  # 0.5s at 16kHz
+    # Audio buffers (pooled blocks, grown on demand, swapped out per utterance)
+    max_buffer_bytes: int = _MAX_BUFFER_SAMPLES * 2
+    _speech_window: AudioWindow = field(init=False)
+    # Samples left over from the last chunk, fewer than one VAD frame
+    _vad_pending: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
     
     # State
     _is_speaking: bool = False
     _speech_start_time: float = 0.0
     _silence_start_time: float = 0.0
+    _utterance_seq: int = 0
+    _bytes_since_partial: int = 0
+    _partial_inflight: bool = False
     
     # Threading
     _lock: threading.Lock = field(default_factory=threading.Lock)
     _closed: bool = False
+    last_access: float = field(default_factory=time.monotonic)
+    # Live streams feeding this session (guarded by the manager lock)
+    _streams: int = 0
+    # Whisper jobs submitted for this session and not yet finished
+    _jobs: set[futures.Future] = field(default_factory=set)
     
     # Shared models (references, not copies)
     _whisper_model: WhisperModel = field(init=False)
@@ -74,35 +279,52 @@ class SpeechSession:
     
     def __post_init__(self):
         self._whisper_model, self._vad_model = get_shared_models()
+        self._speech_window = self._new_window()
     
-    def feed_audio(self, audio_chunk: bytes) -> None:
-        """Feed audio chunk for VAD and buffering."""
+    def _new_window(self) -> AudioWindow:
+        return AudioWindow(self.max_buffer_bytes, _AUDIO_BLOCKS)
+    
+    def feed_audio(self, audio_chunk: bytes | memoryview) -> None:
+        """
+        Feed audio chunk for VAD and buffering.
+        
+        The chunk is copied once, straight into the pooled utterance blocks
+        (a memoryview over the protobuf bytes avoids any other copy).
+        """
         if self._closed or not audio_chunk:
             return
         
+        self.last_access = time.monotonic()
+        
         # Convert to float32 outside lock
-        audio_array = np.frombuffer(audio_chunk, dtype=np.int16).astype(np.float32) / 32768.0
+        audio_array = pcm16_to_f32(np.frombuffer(audio_chunk, dtype=np.int16))
         
         with self._lock:
-            # Always buffer audio
-            self._speech_chunks.append(audio_chunk)
+            # cleanup() may have run while we were converting
+            if self._closed:
+                return
+            
+            # Always buffer audio; the window keeps only the newest
+            # max_buffer_bytes so Whisper cost stays bounded
+            self._speech_window.append(audio_chunk)
+            self._bytes_since_partial += len(audio_chunk)
             
             # Process through VAD
-            self._vad_buffer.extend(audio_array)
+            samples = audio_array
+            if len(self._vad_pending):
+                samples = np.concatenate((self._vad_pending, audio_array))
+            offset = 0
             
             # Process in 512-sample frames
-            while len(self._vad_buffer) >= 512:
-                # Get frame (efficient with deque)
-                frame = np.array(list(self._vad_buffer)[:512])
-                
-                # Remove processed samples
-                for _ in range(512):
-                    self._vad_buffer.popleft()
+            while len(samples) - offset >= _VAD_FRAME_SAMPLES:
+                # Frames are views into the converted chunk, no per-sample copies
+                frame = samples[offset:offset + _VAD_FRAME_SAMPLES]
+                offset += _VAD_FRAME_SAMPLES
                 
                 # VAD detection
                 with torch.no_grad():
                     speech_prob = self._vad_model(
-                        torch.FloatTensor(frame).unsqueeze(0),
+                        torch.from_numpy(frame).unsqueeze(0),
                         self.sample_rate
                     ).item()
                 
@@ -115,6 +337,7 @@ class SpeechSession:
                         self._is_speaking = True
                         self._speech_start_time = current_time
                         self._silence_start_time = 0.0
+                        self._bytes_since_partial = 0
                         logger.debug(f"[{self.session_id}] Speech started")
                 else:
                     if self._is_speaking:
@@ -128,39 +351,105 @@ class SpeechSession:
                         if silence_duration >= self.silence_threshold:
                             speech_duration = self._silence_start_time - self._speech_start_time
                             
+                            self._utterance_seq += 1
+                            
                             if speech_duration >= self.min_speech_duration:
                                 # Transcribe in background
-                                audio_to_transcribe = b''.join(self._speech_chunks)
-                                threading.Thread(
-                                    target=self._transcribe_async,
-                                    args=(audio_to_transcribe,),
-                                    daemon=True
-                                ).start()
+                                self._track_job(transcription_pool.submit(
+                                    self._transcribe_async,
+                                    self._speech_window,
+                                ))
+                                # The transcription job owns the old window now
+                                self._speech_window = self._new_window()
+                            else:
+                                self._speech_window.clear()
                             
                             # Reset
-                            self._speech_chunks.clear()
                             self._is_speaking = False
                             self._speech_start_time = 0.0
                             self._silence_start_time = 0.0
                             logger.debug(f"[{self.session_id}] Utterance complete")
+            
+            self._vad_pending = samples[offset:]
+            
+            # Between utterances keep only a short pre-roll, so silence never
+            # fills the window or gets decoded along with the next utterance
+            if not self._is_speaking:
+                self._speech_window.keep_last(int(_PREROLL_SECONDS * self.sample_rate) * 2)
+            
+            self._maybe_transcribe_partial()
     
-    def _transcribe_async(self, audio_data: bytes):
-        """Transcribe audio in background thread."""
+    def _maybe_transcribe_partial(self) -> None:
+        """Kick off a partial transcription of the utterance so far (lock held)."""
+        if (
+            self.partial_callback is None
+            or self.partial_interval <= 0
+            or not self._is_speaking
+            or self._partial_inflight
+            or self._bytes_since_partial < self.partial_interval * self.sample_rate * 2
+        ):
+            return
+        
+        # Best effort: skip this pass unless a Whisper worker is idle, so
+        # partials never queue ahead of final transcriptions
+        job = transcription_pool.try_submit(self._transcribe_partial)
+        if job is None:
+            return
+        
+        self._bytes_since_partial = 0
+        self._partial_inflight = True
+        self._track_job(job)
+    
+    def _track_job(self, job: futures.Future) -> None:
+        self._jobs.add(job)
+        job.add_done_callback(self._jobs.discard)
+    
+    def pending_transcriptions(self) -> list[futures.Future]:
+        """Whisper jobs for this session still queued or running."""
+        return [job for job in list(self._jobs) if not job.done()]
+    
+    def _transcribe_partial(self):
+        """Transcribe the in-progress utterance on the transcription pool."""
         try:
-            # Convert to numpy array
-            audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+            # Snapshot once the worker has started, so skipped passes cost nothing
+            with self._lock:
+                if self._closed or not self._is_speaking:
+                    return
+                audio_data = self._speech_window.tobytes()
+                utterance_seq = self._utterance_seq
             
-            # Transcribe (no temp file!)
-            segments, info = self._whisper_model.transcribe(
-                audio_array,
-                language="en",
-                beam_size=1,
-                best_of=1,
-                temperature=0.0,
-                without_timestamps=True
-            )
+            text = self._transcribe(audio_data)
             
-            text = " ".join([seg.text for seg in segments]).strip()
+            # Drop partials for an utterance that has already been finalized
+            if text and self.partial_callback and utterance_seq == self._utterance_seq:
+                self.partial_callback(text)
+        
+        except Exception as e:
+            logger.error(f"[{self.session_id}] Partial transcription error: {e}", exc_info=True)
+        finally:
+            self._partial_inflight = False
+    
+    def _transcribe(self, audio_data: bytes) -> str:
+        """Transcribe raw PCM16 mono audio straight from memory."""
+        # Whisper takes float32 samples in [-1, 1]; no WAV/ffmpeg round-trip
+        raw = np.frombuffer(audio_data, dtype=np.int16, count=len(audio_data) // 2)
+        audio_array = _AUDIO_POOL.acquire_float32(len(raw))
+        # Single pass straight into the pooled buffer, no temporaries
+        pcm16_to_f32(raw, audio_array)
+        del raw
+
+        try:
+            return _decode(self._whisper_model, audio_array)
+        finally:
+            _AUDIO_POOL.release(audio_array)
+
+    def _transcribe_async(self, window: AudioWindow):
+        """Transcribe a finished utterance on the transcription pool."""
+        try:
+            # Linearize once and hand the blocks back before the long decode
+            audio_data = window.tobytes()
+            window.clear()
+            text = self._transcribe(audio_data)
             
             if text and self.transcription_callback:
                 logger.info(f"[{self.session_id}] Transcribed: {text}")
@@ -174,22 +463,14 @@ class SpeechSession:
         """Finalize transcription and return final text."""
         with self._lock:
             # Transcribe any remaining buffered audio
-            if self._speech_chunks and self._is_speaking:
-                audio_to_transcribe = b''.join(self._speech_chunks)
+            if len(self._speech_window) and self._is_speaking:
+                audio_data = self._speech_window.tobytes()
+                self._speech_window.clear()
+                self._utterance_seq += 1
                 try:
-                    audio_array = np.frombuffer(audio_to_transcribe, dtype=np.int16).astype(np.float32) / 32768.0
-                    segments, info = self._whisper_model.transcribe(
-                        audio_array,
-                        language="en",
-                        beam_size=1,
-                        best_of=1,
-                        temperature=0.0,
-                        without_timestamps=True
-                    )
-                    text = " ".join([seg.text for seg in segments]).strip()
+                    text = self._transcribe(audio_data)
                     # Reset session
-                    self._speech_chunks.clear()
-                    self._vad_buffer.clear()
+                    self._vad_pending = self._vad_pending[:0]
                     self._is_speaking = False
                     self._speech_start_time = 0.0
                     self._silence_start_time = 0.0
@@ -204,30 +485,98 @@ class SpeechSession:
         """Cleanup session resources."""
         with self._lock:
             self._closed = True
-            self._speech_chunks.clear()
-            self._vad_buffer.clear()
+            self._speech_window.clear()
+            self._vad_pending = self._vad_pending[:0]
             # Don't delete shared models
         
         logger.info(f"[{self.session_id}] Cleaned up")
 
 
 class SessionManager:
-    def __init__(self):
+    """
+    Tracks live sessions.
+
+    A background reaper evicts sessions idle longer than ``idle_ttl_s`` and,
+    least recently fed first, any beyond ``max_sessions``. Sessions attached
+    to a live stream, or whose lock is held (mid-VAD or mid-transcription),
+    are never evicted.
+    """
+
+    REAP_INTERVAL_S = 30.0
+
+    def __init__(
+        self,
+        max_sessions: int = config.server.max_sessions,
+        idle_ttl_s: float = config.server.session_idle_ttl_s,
+    ):
         self._sessions: dict[str, SpeechSession] = {}
         self._lock = threading.Lock()
+        self._max_sessions = max_sessions
+        self._idle_ttl_s = idle_ttl_s
+        
+        threading.Thread(
+            target=self._reap_loop,
+            daemon=True,
+            name="SessionReaper",
+        ).start()
     
     def get_or_create(
         self,
         session_id: str,
-        transcription_callback: Optional[Callable[[str], None]] = None
+        transcription_callback: Optional[Callable[[str], None]] = None,
+        partial_callback: Optional[Callable[[str], None]] = None
     ) -> SpeechSession:
         with self._lock:
-            if session_id not in self._sessions:
-                self._sessions[session_id] = SpeechSession(
-                    session_id=session_id,
-                    transcription_callback=transcription_callback
-                )
-            return self._sessions[session_id]
+            return self._get_or_create(session_id, transcription_callback, partial_callback)
+    
+    def _get_or_create(
+        self,
+        session_id: str,
+        transcription_callback: Optional[Callable[[str], None]],
+        partial_callback: Optional[Callable[[str], None]]
+    ) -> SpeechSession:
+        """Look up or create a session (manager lock held)."""
+        if session_id not in self._sessions:
+            self._sessions[session_id] = SpeechSession(
+                session_id=session_id,
+                transcription_callback=transcription_callback,
+                partial_callback=partial_callback
+            )
+        return self._sessions[session_id]
+    
+    def attach(
+        self,
+        session_id: str,
+        transcription_callback: Optional[Callable[[str], None]] = None,
+        partial_callback: Optional[Callable[[str], None]] = None
+    ) -> SpeechSession:
+        """
+        Get or create a session for a live stream; pair with ``detach``.
+        
+        The newest stream takes over output: an existing session's callbacks
+        are rebound to this stream's.
+        """
+        with self._lock:
+            session = self._get_or_create(session_id, transcription_callback, partial_callback)
+            session.transcription_callback = transcription_callback
+            session.partial_callback = partial_callback
+            session._streams += 1
+            return session
+    
+    def detach(self, session: SpeechSession) -> bool:
+        """Release a stream's hold on the session ``attach`` returned; the last one out cleans up."""
+        with self._lock:
+            session._streams -= 1
+            if session._streams > 0:
+                return False
+            # Matched by identity: after CleanupSession or a reconnect the id
+            # may belong to a fresh session that this stream must not touch
+            if self._sessions.get(session.session_id) is not session:
+                return False
+            del self._sessions[session.session_id]
+        
+        session.cleanup()
+        return True
     
     def cleanup(self, session_id: str) -> bool:
         with self._lock:
@@ -237,6 +586,41 @@ class SessionManager:
                 return True
             return False
     
+    def evict_stale(self) -> int:
+        """Evict idle and over-capacity sessions; returns how many were evicted."""
+        cutoff = time.monotonic() - self._idle_ttl_s
+        evicted: list[SpeechSession] = []
+        
+        with self._lock:
+            overflow = len(self._sessions) - self._max_sessions
+            # last_access moves on every chunk, so it (not creation order)
+            # decides who goes first on overflow
+            by_age = sorted(self._sessions.items(), key=lambda item: item[1].last_access)
+            for session_id, session in by_age:
+                if overflow <= 0 and session.last_access >= cutoff:
+                    break
+                if session._streams or session._lock.locked():
+                    continue
+                del self._sessions[session_id]
+                evicted.append(session)
+                overflow -= 1
+        
+        # Session cleanup takes the session lock; keep it off the manager lock
+        for session in evicted:
+            session.cleanup()
+        
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} stale session(s)")
+        return len(evicted)
+    
+    def _reap_loop(self):
+        while True:
+            time.sleep(self.REAP_INTERVAL_S)
+            try:
+                self.evict_stale()
+            except Exception as e:
+                logger.error(f"Session reaper error: {e}", exc_info=True)
+    
     @property
     def active_session_count(self) -> int:
         with self._lock:
@@ -0,0 +1,86 @@
+"""Unit tests for the pooled utterance window."""
+
+from src.audio_window import AudioWindow, BlockPool
+
+
+def make_window(capacity: int, block_size: int = 4) -> tuple[AudioWindow, BlockPool]:
+    pool = BlockPool(block_size=block_size, max_pooled=8)
+    return AudioWindow(capacity, pool), pool
+
+
+def test_append_within_capacity_spans_blocks():
+    window, _ = make_window(capacity=16)
+    window.append(b"abcdef")
+    window.append(memoryview(b"ghij"))
+
+    assert len(window) == 10
+    assert window.tobytes() == b"abcdefghij"
+
+
+def test_overflow_keeps_newest_bytes():
+    window, _ = make_window(capacity=8)
+    window.append(b"abcdef")
+    window.append(b"ghij")
+
+    assert window.tobytes() == b"cdefghij"
+    window.append(b"kl")
+    assert window.tobytes() == b"efghijkl"
+
+
+def test_oversized_chunk_keeps_its_tail():
+    window, _ = make_window(capacity=8)
+    window.append(b"abcd")
+    window.append(b"0123456789AB")
+
+    assert window.tobytes() == b"456789AB"
+
+
+def test_odd_cut_point_rounds_up_to_even_byte():
+    window, _ = make_window(capacity=8)
+    window.append(b"abcdefg")
+    # Nine bytes against a cap of eight: the cut moves to byte two, not one
+    window.append(b"hi")
+    assert window.tobytes() == b"cdefghi"
+
+    # Oversized odd chunk: drop 13 - 8 = 5 -> 6 leading bytes
+    window.clear()
+    window.append(b"0123456789ABC")
+    assert window.tobytes() == b"6789ABC"
+
+
+def test_odd_capacity_is_rounded_down_to_whole_samples():
+    window, _ = make_window(capacity=7)
+    window.append(b"0123456789")
+
+    assert window.capacity == 6
+    assert window.tobytes() == b"456789"
+
+
+def test_keep_last_trims_to_preroll():
+    window, _ = make_window(capacity=32)
+    window.append(b"0123456789")
+    window.keep_last(4)
+    assert window.tobytes() == b"6789"
+
+    window.keep_last(3)
+    assert window.tobytes() == b"89"
+
+    window.keep_last(16)
+    assert window.tobytes() == b"89"
+
+
+def test_dropped_and_cleared_blocks_return_to_pool():
+    window, pool = make_window(capacity=8, block_size=4)
+    window.append(b"abcdefgh")
+    oldest = window._blocks[0]
+    window.append(b"ijkl")
+    # The fully dropped oldest block went back to the pool and was reused
+    assert window._blocks[-1] is oldest
+    assert window.tobytes() == b"efghijkl"
+
+    window.clear()
+    assert pool._blocks.qsize() == 2
+    assert len(window) == 0
+    assert window.tobytes() == b""
+    window.append(b"xy")
+    assert window.tobytes() == b"xy"
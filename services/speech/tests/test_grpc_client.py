@@ -76,6 +76,7 @@ def run_client(server_addr: str):
                     session_id=session_id,
                     audio_chunk=data,
                     end_of_stream=False,
+                    partial_results=True,
                 )
 
                 # Check if enough silence to end stream
@@ -107,6 +108,10 @@ def run_client(server_addr: str):
                 print(f"❌ Server error: {resp.error}")
                 continue
 
+            if resp.partial:
+                print(f"\r[Live]: {resp.transcription.strip()}", end="", flush=True)
+                continue
+
             if resp.transcription:
                 recv_ts = time.time()
                 sent_ts = last_speech_ts["value"]
@@ -123,7 +128,14 @@ def run_client(server_addr: str):
     # -------------------------------
     # gRPC connection
     # -------------------------------
-    with grpc.insecure_channel(server_addr) as channel:
+    # Keepalive settings matching the server's policy
+    channel_options = [
+        ("grpc.keepalive_time_ms", 30_000),
+        ("grpc.keepalive_timeout_ms", 10_000),
+        ("grpc.keepalive_permit_without_calls", 1),
+    ]
+
+    with grpc.insecure_channel(server_addr, options=channel_options) as channel:
         stub = speech_pb2_grpc.SpeechServiceStub(channel)
         response_stream = stub.StreamTranscribe(audio_generator())
 
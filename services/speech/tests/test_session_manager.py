@@ -0,0 +1,99 @@
+"""Unit tests for SessionManager eviction and stream attachment."""
+
+import threading
+import time
+from dataclasses import dataclass, field
+
+from src.session_manager import SessionManager
+
+
+@dataclass
+class FakeSession:
+    """Just the surface SessionManager touches; no models are loaded."""
+
+    session_id: str
+    last_access: float = field(default_factory=time.monotonic)
+    _streams: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    closed: bool = False
+
+    def cleanup(self):
+        self.closed = True
+
+
+def make_manager(*sessions: FakeSession, max_sessions: int = 100, idle_ttl_s: float = 300.0) -> SessionManager:
+    manager = SessionManager(max_sessions=max_sessions, idle_ttl_s=idle_ttl_s)
+    for session in sessions:
+        manager._sessions[session.session_id] = session
+    return manager
+
+
+def test_evict_stale_skips_attached_sessions():
+    now = time.monotonic()
+    attached = FakeSession("attached", last_access=now - 1000, _streams=1)
+    idle = FakeSession("idle", last_access=now - 1000)
+    fresh = FakeSession("fresh", last_access=now)
+    manager = make_manager(attached, idle, fresh, idle_ttl_s=300.0)
+
+    assert manager.evict_stale() == 1
+    assert idle.closed
+    assert not attached.closed and not fresh.closed
+    assert set(manager._sessions) == {"attached", "fresh"}
+
+
+def test_evict_stale_skips_locked_sessions():
+    locked = FakeSession("locked", last_access=time.monotonic() - 1000)
+    manager = make_manager(locked, idle_ttl_s=300.0)
+
+    with locked._lock:
+        assert manager.evict_stale() == 0
+    assert manager.evict_stale() == 1
+
+
+def test_overflow_evicts_least_recently_fed_first():
+    now = time.monotonic()
+    # Inserted oldest-created first, but "first" was fed most recently
+    first = FakeSession("first", last_access=now - 1)
+    second = FakeSession("second", last_access=now - 3)
+    third = FakeSession("third", last_access=now - 2)
+    manager = make_manager(first, second, third, max_sessions=1)
+
+    assert manager.evict_stale() == 2
+    assert set(manager._sessions) == {"first"}
+    assert second.closed and third.closed
+
+
+def test_overflow_skips_attached_sessions():
+    now = time.monotonic()
+    oldest = FakeSession("oldest", last_access=now - 3, _streams=1)
+    middle = FakeSession("middle", last_access=now - 2)
+    newest = FakeSession("newest", last_access=now - 1)
+    manager = make_manager(oldest, middle, newest, max_sessions=2)
+
+    assert manager.evict_stale() == 1
+    assert set(manager._sessions) == {"oldest", "newest"}
+
+
+def test_detach_matches_session_identity():
+    stale = FakeSession("s", _streams=1)
+    replacement = FakeSession("s", _streams=1)
+    manager = make_manager(replacement)
+
+    # A stream whose session was replaced must not touch the new one
+    assert not manager.detach(stale)
+    assert manager._sessions["s"] is replacement
+    assert replacement._streams == 1 and not replacement.closed
+
+    assert manager.detach(replacement)
+    assert replacement.closed
+    assert "s" not in manager._sessions
+
+
+def test_detach_keeps_session_while_other_streams_remain():
+    session = FakeSession("s", _streams=2)
+    manager = make_manager(session)
+
+    assert not manager.detach(session)
+    assert not session.closed
+    assert manager.detach(session)
+    assert session.closed